@@ -1,7 +1,5 @@
 import errno
-import glob
 import os
-import re
 import shutil
 import signal
 import sys
@@ -19,6 +17,7 @@ from lib.server import DEFAULT_SNAPSHOT_NAME
 from lib.tarantool_server import Test
 from lib.tarantool_server import TarantoolServer
 from lib.tarantool_server import TarantoolStartError
+from lib.utils import find_files_by_suffix
 from lib.utils import format_process
 from lib.utils import signame
 from lib.utils import warn_unix_socket
@@ -133,7 +132,7 @@ class AppServer(Server):
             cli_args.extend(['-e', self.DISABLE_AUTO_UPGRADE])
 
         # Add path to the script (the test).
-        cli_args.extend([os.path.join(os.getcwd(), self.current_test.name)])
+        cli_args.extend([os.path.join(self.testdir, self.current_test.name)])
 
         # Add extra args if provided.
         cli_args.extend(args)
@@ -142,8 +141,7 @@ class AppServer(Server):
 
     def deploy(self, vardir=None, silent=True, need_init=True):
         self.vardir = vardir
-        if not os.access(self.vardir, os.F_OK):
-            os.makedirs(self.vardir)
+        os.makedirs(self.vardir, exist_ok=True)
         if self.lua_libs:
             for i in self.lua_libs:
                 source = os.path.join(self.testdir, i)
@@ -164,8 +162,7 @@ class AppServer(Server):
             self.listen_uri = path
         else:
             self.listen_uri = self.localhost + ':0'
-        shutil.copy(os.path.join(self.TEST_RUN_DIR, 'test_run.lua'),
-                    self.vardir)
+        shutil.copy(self.TEST_RUN_LUA, self.vardir)
 
         # Note: we don't know the instance name of the tarantool server, so
         # cannot check length of path of *.control unix socket created by it.
@@ -229,27 +226,21 @@ class AppServer(Server):
     def find_exe(cls, builddir):
         cls.builddir = builddir
         cls.binary = TarantoolServer.binary
-        cls.debug = bool(re.findall(r'^Target:.*-Debug$', str(cls.version()),
-                                    re.M))
+        # The same executable, so reuse the build type found by
+        # TarantoolServer.find_exe() instead of running it again.
+        cls.debug = TarantoolServer.debug
 
     @staticmethod
     def find_tests(test_suite, suite_path):
-        def patterned(test_name, patterns):
-            answer = []
-            for i in patterns:
-                if test_name.find(i) != -1:
-                    answer.append(test_name)
-            return answer
-
-        def is_correct(run):
-            return test_suite.args.conf is None or test_suite.args.conf == run
-
         test_suite.ini['suite'] = suite_path
 
-        test_names = sorted(glob.glob(os.path.join(suite_path, "*.test.lua")))
+        test_names = sorted(find_files_by_suffix(suite_path, '.test.lua'))
         test_names = Server.exclude_tests(test_names, test_suite.args.exclude)
-        test_names = sum(map((lambda x: patterned(x, test_suite.args.tests)),
-                             test_names), [])
+        # Add a test once for each include pattern that matches it.
+        test_names = [test_name for test_name in test_names
+                      for pattern in test_suite.args.tests
+                      if pattern in test_name]
+        conf = test_suite.args.conf
         tests = []
 
         for test_name in test_names:
@@ -262,7 +253,7 @@ class AppServer(Server):
                     params=params,
                     conf_name=conf_name
                 ) for conf_name, params in runs.items()
-                    if is_correct(conf_name)])
+                    if conf is None or conf == conf_name])
             else:
                 tests.append(AppTest(test_name,
                                      test_suite.args,
@@ -21,9 +21,6 @@ __author__ = "Konstantin Osipov <kostja.osipov@gmail.com>"
 # OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE POSSIBILITY OF
 # SUCH DAMAGE.
 
-import errno
-import ctypes
-import re
 import socket
 
 from lib.tarantool_connection import TarantoolConnection
@@ -43,7 +40,7 @@ SEPARATOR = '\n'
 class BoxConnection(TarantoolConnection):
     def __init__(self, host, port):
         super(BoxConnection, self).__init__(host, port)
-        if self.host == 'unix/' or re.search(r'^/', str(self.port)):
+        if self.host == 'unix/' or str(self.port).startswith('/'):
             warn_unix_socket(self.port)
             host = None
 
@@ -70,12 +67,24 @@ class BoxConnection(TarantoolConnection):
         self.py_con.schema = Schema(schemadict)
 
     def check_connection(self):
-        self.py_con._sys_recv(self.py_con._socket.fileno(), '  ', 1,
-                              socket.MSG_DONTWAIT | socket.MSG_PEEK)
-        if ctypes.get_errno() == errno.EAGAIN:
-            ctypes.set_errno(0)
+        """ A peek on a closed socket returns no data, while on an
+            alive one it fails with EAGAIN (or returns pending data).
+
+            The connection socket has a timeout and Python waits for
+            it before recv() even with MSG_DONTWAIT, so switch the
+            socket to the non-blocking mode for the peek.
+        """
+        sock = self.py_con._socket
+        timeout = sock.gettimeout()
+        sock.setblocking(False)
+        try:
+            return sock.recv(1, socket.MSG_PEEK) != b''
+        except BlockingIOError:
             return True
-        return False
+        except socket.error:
+            return False
+        finally:
+            sock.settimeout(timeout)
 
     def execute_no_reconnect(self, command, silent=True):
         if not command:
@@ -91,11 +100,18 @@ class BoxConnection(TarantoolConnection):
     def execute(self, command, silent=True):
         return self.execute_no_reconnect(command, silent)
 
-    def call(self, command, *args):
+    def call(self, command, *args, silent=False):
+        """ Call a stored procedure and print the call and the response
+            (to the test output). With silent=True print nothing and
+            return the raw response instead of its string form.
+        """
         if not command:
             return
-        print('call  {} {}'.format(command, args))
+        if not silent:
+            print('call  {} {}'.format(command, args))
         response = self.py_con.call(command, *args)
+        if silent:
+            return response
         result = str(response)
         print(result)
         return result
@@ -87,31 +87,30 @@ def test_line(name, conf=None):
 
 class CSchema(object):
     objects = {}
-
-    def __init__(self):
-        self.main_objects = {
-            'diff_mark': {},
-            'diff_in':   {},
-            'diff_out':  {},
-            'test_pass': {},
-            'test_fail': {},
-            'test_new':  {},
-            'test_skip': {},
-            'test_disa': {},
-            'error':     {},
-            'lerror':    {},
-            'tail':      {},
-            'ts_text':   {},
-            'path':      {},
-            'info':      {},
-            'separator': {},
-            't_name':    {},
-            'serv_text': {},
-            'version':   {},
-            'tr_text':   {},
-            'log':       {},
-        }
-        self.main_objects.update(self.objects)
+    # Schema objects are static, so merge them once at the class
+    # definition.
+    main_objects = {
+        'diff_mark': {},
+        'diff_in':   {},
+        'diff_out':  {},
+        'test_pass': {},
+        'test_fail': {},
+        'test_new':  {},
+        'test_skip': {},
+        'test_disa': {},
+        'error':     {},
+        'lerror':    {},
+        'tail':      {},
+        'ts_text':   {},
+        'path':      {},
+        'info':      {},
+        'separator': {},
+        't_name':    {},
+        'serv_text': {},
+        'version':   {},
+        'tr_text':   {},
+        'log':       {},
+    }
 
 
 class SchemaAscetic(CSchema):
@@ -133,6 +132,7 @@ class SchemaAscetic(CSchema):
         'test-run command':  {'fgcolor': 'green'},
         'tarantool command': {'fgcolor': 'blue'},
     }
+    main_objects = dict(CSchema.main_objects, **objects)
 
 
 class SchemaPretty(CSchema):
@@ -164,6 +164,7 @@ class SchemaPretty(CSchema):
         'test-run command':  {'fgcolor': 'green'},
         'tarantool command': {'fgcolor': 'blue'},
     }
+    main_objects = dict(CSchema.main_objects, **objects)
 
 
 class Colorer(object):
@@ -218,7 +219,9 @@ class Colorer(object):
     begin = "\033["
     end = "m"
     disable = begin+'0'+end
-    color_re = re.compile('\033' + r'\[\d(?:;\d\d)?m')
+    # write() keyword arguments, which set a style directly.
+    style_keys = frozenset(attributes) | {'fgcolor', 'bgcolor'}
+    color_re = re.compile('\033' + r'\[\d(?:;\d\d)?m', re.ASCII)
 
     def __init__(self):
         # These two fields can be filled later. It's for passing output from
@@ -229,23 +232,15 @@ class Colorer(object):
 
         self.stdout = sys.stdout
         self.is_term = self.stdout.isatty()
-        self.colors = None
-        if self.is_term:
-            try:
-                p = os.popen('tput colors 2>/dev/null')
-                self.colors = int(p.read())
-            except:  # noqa: E722
-                pass
-            finally:
-                p.close()
         schema = os.getenv('TT_SCHEMA', 'ascetic')
         if schema == 'ascetic':
-            self.schema = SchemaAscetic()
+            self.schema = SchemaAscetic.main_objects
         elif schema == 'pretty':
-            self.schema = SchemaPretty()
+            self.schema = SchemaPretty.main_objects
         else:
-            self.schema = CSchema()
-        self.schema = self.schema.main_objects
+            self.schema = CSchema.main_objects
+        # Escape sequences for schemas, filled on first use.
+        self.schema_prefix = {}
 
     def set_stdout(self):
         sys.stdout = self
@@ -265,33 +260,53 @@ class Colorer(object):
         if not self.queue:
             self.stdout.flush()
 
+    def _prefix(self, style):
+        """ Build an escape sequence for the given style options.
+        """
+        flags = [self.attributes[i] for i in self.attributes
+                 if style.get(i) is True]
+        if 'fgcolor' in style:
+            flags.append(self.fgcolor[style['fgcolor']])
+        if 'bgcolor' in style:
+            flags.append(self.bgcolor[style['bgcolor']])
+        if not flags:
+            return ''
+        return self.begin + ';'.join(flags) + self.end
+
+    def _style_prefix(self, kwargs):
+        """ Get an escape sequence for write() options.
+
+            A schema is a fixed set of options, so cache its sequence
+            unless it is mixed with explicitly given style options.
+        """
+        if 'schema' not in kwargs:
+            return self._prefix(kwargs)
+        schema = kwargs['schema']
+        if not self.style_keys.isdisjoint(kwargs):
+            return self._prefix(dict(kwargs, **self.schema[schema]))
+        prefix = self.schema_prefix.get(schema)
+        if prefix is None:
+            prefix = self._prefix(self.schema[schema])
+            self.schema_prefix[schema] = prefix
+        return prefix
+
     def write(self, *args, **kwargs):
-        flags = []
-        if 'schema' in kwargs:
-            kwargs.update(self.schema[kwargs['schema']])
-        for i in self.attributes:
-            if i in kwargs and kwargs[i] is True:
-                flags.append(self.attributes[i])
-        flags.append(self.fgcolor[kwargs['fgcolor']]) \
-            if 'fgcolor' in kwargs else None
-        flags.append(self.bgcolor[kwargs['bgcolor']]) \
-            if 'bgcolor' in kwargs else None
-
-        data = ''
-        if self.is_term and flags:
-            data += self.begin + (';'.join(flags)) + self.end
-        for i in args:
-            data += str(i)
+        data = ''.join([str(i) for i in args])
         if self.is_term:
+            prefix = self._style_prefix(kwargs)
             # write 'color disable' before newline to better work with parallel
             # processes writing signle stdout/stderr
             if data.endswith('\n'):
-                data = data[:-1] + self.disable + '\n'
+                data = prefix + data[:-1] + self.disable + '\n'
             else:
-                data += self.disable
+                data = prefix + data + self.disable
         if data:
             self._write(data, kwargs.get('log_only', False))
-        self._flush()
+        # Show a partial line (say, a test name before its result)
+        # at once on a terminal. Otherwise let the stream buffer it
+        # until the line is complete.
+        if self.is_term or not data or data.endswith('\n'):
+            self._flush()
 
     def __call__(self, *args, **kwargs):
         self.write(*args, **kwargs)
@@ -321,6 +336,9 @@ class Colorer(object):
         return self.is_term
 
     def decolor(self, data):
+        # Most of the data has no escape sequences at all.
+        if '\033' not in data:
+            return data
         return self.color_re.sub('', data)
 
 
@@ -6,7 +6,6 @@ import gevent
 from gevent.lock import Semaphore
 from gevent.server import StreamServer
 
-from lib.utils import bytes_to_str
 from lib.utils import prefix_each_line
 from lib.utils import str_to_bytes
 from lib.colorer import color_stdout
@@ -16,6 +15,16 @@ from lib.colorer import qa_notice
 from lib.tarantool_server import TarantoolStartError
 from lib.preprocessor import LuaPreprocessorException
 
+try:
+    # libyaml based dumper
+    from yaml import CSafeDumper as YamlDumper
+except ImportError:
+    # PyYAML is built without libyaml
+    from yaml import SafeDumper as YamlDumper
+
+# Most of commands have no result and are answered with 'true'.
+RESPONSE_TRUE = 'true\n...\n'
+
 
 # Module initialization
 #######################
@@ -69,20 +78,31 @@ class TarantoolInspector(StreamServer):
 
     @staticmethod
     def readline(socket, delimiter='\n', size=4096):
-        result = ''
+        delimiter = str_to_bytes(delimiter)
+        # Accumulate raw bytes and decode complete lines only: it
+        # saves re-allocating the whole pending string on each recv
+        # and does not break on a multibyte character split between
+        # two chunks.
+        buf = bytearray()
+        find = buf.find
+        recv = socket.recv
         data = True
 
         while data:
             try:
-                data = bytes_to_str(socket.recv(size))
+                data = recv(size)
             except IOError:
                 # catch instance halt connection refused errors
-                data = ''
-            result += data
-
-            while result.find(delimiter) != -1:
-                line, result = result.split(delimiter, 1)
-                yield line
+                data = b''
+            buf.extend(data)
+
+            start = 0
+            end = find(delimiter)
+            while end != -1:
+                yield buf[start:end].decode('utf-8')
+                start = end + len(delimiter)
+                end = find(delimiter, start)
+            del buf[:start]
         return
 
     def handle(self, socket, addr):
@@ -108,11 +128,12 @@ class TarantoolInspector(StreamServer):
                              'following error:\n' + traceback.format_exc() +
                              '\n', schema='error')
                 result = {"error": repr(e)}
-            if result is None:
-                result = True
-            result = yaml.dump(result)
-            if not result.endswith('...\n'):
-                result = result + '...\n'
+            if result is None or result is True:
+                result = RESPONSE_TRUE
+            else:
+                result = yaml.dump(result, Dumper=YamlDumper)
+                if not result.endswith('...\n'):
+                    result = result + '...\n'
             color_log("DEBUG: test-run's response for [{}]\n{}\n".format(
                 line, prefix_each_line(' | ', result)),
                 schema='test-run command')
@@ -1,11 +1,9 @@
-import glob
 import os
-import re
 import sys
 
 from subprocess import PIPE
 from subprocess import Popen
-from threading import Timer
+from subprocess import TimeoutExpired
 
 from lib.colorer import color_stdout
 from lib.error import TestRunInitError
@@ -16,12 +14,9 @@ from lib.tarantool_server import Test
 from lib.tarantool_server import TestExecutionError
 from lib.tarantool_server import TarantoolServer
 from lib.utils import bytes_to_str
+from lib.utils import find_files_by_suffix
 from lib.utils import find_tags
-
-
-def timeout_handler(process, test_timeout):
-    color_stdout("Test timeout of %d secs reached\t" % test_timeout, schema='error')
-    process.kill()
+from lib.utils import substring_re
 
 
 class LuatestTest(Test):
@@ -34,6 +29,16 @@ class LuatestTest(Test):
         super(LuatestTest, self).__init__(*args, **kwargs)
         self.valgrind = kwargs.get('valgrind', False)
 
+        # Remove the suite name using basename().
+        log_name = os.path.basename(self.name)
+        # Strip '.lua' from the end.
+        #
+        # The '_test' postfix is kept to ease distinguish this
+        # log file from luatest.server instance logs.
+        log_name = log_name[:-len('.lua')]
+        # Add '.log'. See LuatestServer.logfile.
+        self.log_name = log_name + '.log'
+
     def execute(self, server):
         """Execute test by luatest command
 
@@ -43,18 +48,21 @@ class LuatestTest(Test):
         corresponding option is provided.
         """
         server.current_test = self
-        script = os.path.join(os.path.basename(server.testdir), self.name)
-
-        # Disable stdout buffering.
-        command = [server.binary, '-e', "io.stdout:setvbuf('no')"]
-        # Add luatest as the script.
-        command.extend([server.luatest])
-        # Add luatest command-line options.
-        command.extend(['-c', '--no-clean', '--verbose', script, '--output', 'tap'])
-        # Add luatest logging option.
-        command.extend(['--log', os.path.join(server.vardir, 'run.log')])
-        if Options().args.pattern:
-            for p in Options().args.pattern:
+        args = Options().args
+        script = os.path.join(server.testdir_name, self.name)
+
+        command = [
+            # Disable stdout buffering.
+            server.binary, '-e', "io.stdout:setvbuf('no')",
+            # Add luatest as the script.
+            server.luatest,
+            # Add luatest command-line options.
+            '-c', '--no-clean', '--verbose', script, '--output', 'tap',
+            # Add luatest logging option.
+            '--log', os.path.join(server.vardir, 'run.log'),
+        ]
+        if args.pattern:
+            for p in args.pattern:
                 command.extend(['--pattern', p])
 
         # Run a specific test case. See find_tests() for details.
@@ -66,18 +74,22 @@ class LuatestTest(Test):
         #
         # VARDIR (${BUILDDIR}/test/var/001_foo) will be used for
         # write ahead logs, snapshots, logs, unix domain sockets
-        # and so on.
-        os.environ['VARDIR'] = server.vardir
-        project_dir = os.environ['SOURCEDIR']
+        # and so on. Pass it to luatest only, the worker's own
+        # environment is left as is.
+        env = dict(os.environ, VARDIR=server.vardir)
 
         with open(server.logfile, 'ab') as f:
-            proc = Popen(command, cwd=project_dir, stdout=sys.stdout, stderr=f)
+            proc = Popen(command, cwd=server.source_dir, env=env,
+                         stdout=sys.stdout, stderr=f)
         sampler.register_process(proc.pid, self.id, server.name)
-        test_timeout = Options().args.test_timeout
-        timer = Timer(test_timeout, timeout_handler, (proc, test_timeout))
-        timer.start()
-        proc.wait()
-        timer.cancel()
+        test_timeout = args.test_timeout
+        try:
+            proc.wait(timeout=test_timeout)
+        except TimeoutExpired:
+            color_stdout("Test timeout of %d secs reached\t" % test_timeout,
+                         schema='error')
+            proc.kill()
+            proc.wait()
         if proc.returncode != 0:
             raise TestExecutionError
 
@@ -85,6 +97,8 @@ class LuatestTest(Test):
 class LuatestServer(Server):
     """A dummy server implementation for luatest server tests"""
 
+    luatest_verified = False
+
     def __new__(cls, ini=None, *args, **kwargs):
         cls = Server.get_mixed_class(cls, ini)
         return object.__new__(cls)
@@ -96,40 +110,39 @@ class LuatestServer(Server):
         ini.update(_ini)
         super(LuatestServer, self).__init__(ini, test_suite)
         self.testdir = os.path.abspath(os.curdir)
+        # Test scripts are passed to luatest relative to the
+        # project source directory, see LuatestTest.execute().
+        self.testdir_name = os.path.basename(self.testdir)
         self.vardir = ini['vardir']
         self.builddir = ini['builddir']
         self.name = 'luatest_server'
 
     @property
     def logfile(self):
-        # Remove the suite name using basename().
-        test_name = os.path.basename(self.current_test.name)
-        # Strip '.lua' from the end.
-        #
-        # The '_test' postfix is kept to ease distinguish this
-        # log file from luatest.server instance logs.
-        test_name = test_name[:-len('.lua')]
-        # Add '.log'.
-        file_name = test_name + '.log'
-        # Put into vardir.
-        return os.path.join(self.vardir, file_name)
+        # Put the test's log file into vardir.
+        return os.path.join(self.vardir, self.current_test.log_name)
 
     def deploy(self, vardir=None, silent=True, wait=True):
         self.vardir = vardir
-        if not os.access(self.vardir, os.F_OK):
-            os.makedirs(self.vardir)
+        os.makedirs(self.vardir, exist_ok=True)
 
     @classmethod
     def find_exe(cls, builddir):
         cls.builddir = builddir
         cls.binary = TarantoolServer.binary
-        cls.debug = bool(re.findall(r'^Target:.*-Debug$', str(cls.version()),
-                                    re.M))
+        # The same executable, so reuse the build type found by
+        # TarantoolServer.find_exe() instead of running it again.
+        cls.debug = TarantoolServer.debug
         cls.luatest = os.environ['TEST_RUN_DIR'] + '/lib/luatest/bin/luatest'
+        cls.source_dir = os.environ['SOURCEDIR']
 
     @classmethod
     def verify_luatest_exe(cls):
         """Verify that luatest executable is available."""
+        # The check is called for each luatest suite, but the
+        # executable is the same.
+        if cls.luatest_verified:
+            return
         try:
             # Just check that the command returns zero exit code.
             with open(os.devnull, 'w') as devnull:
@@ -145,6 +158,7 @@ class LuatestServer(Server):
             # raises FileNotFoundError and PermissionError in
             # those cases, which are childs of OSError anyway.
             raise TestRunInitError('Unable to find luatest executable', e)
+        cls.luatest_verified = True
 
     @classmethod
     def test_cases(cls, test_name):
@@ -173,13 +187,15 @@ class LuatestServer(Server):
 
         # A pattern here means just a substring to find in a test
         # name.
-        include_patterns = Options().args.tests
-        exclude_patterns = Options().args.exclude
+        args = Options().args
+        include_patterns = args.tests
+        exclude_patterns = args.exclude
+        exclude_re = substring_re(exclude_patterns)
 
-        accepted_tags = Options().args.tags
+        accepted_tags = frozenset(args.tags or ())
 
         tests = []
-        for test_name in glob.glob(os.path.join(suite_path, '*_test.lua')):
+        for test_name in find_files_by_suffix(suite_path, '_test.lua'):
             # Several include patterns may match the given
             # test[^1].
             #
@@ -200,7 +216,7 @@ class LuatestServer(Server):
 
             # If at least one of the exclude patterns matches the
             # given test, skip the test.
-            if any(p in test_name for p in exclude_patterns):
+            if exclude_re and exclude_re.search(test_name):
                 continue
 
             tags = find_tags(test_name)
@@ -209,7 +225,7 @@ class LuatestServer(Server):
             if accepted_tags:
                 # ...and the test has neither of the given tags,
                 # skip the test.
-                if not any(t in accepted_tags for t in tags):
+                if accepted_tags.isdisjoint(tags):
                     continue
 
             # Add the test to the execution list otherwise.
@@ -2,7 +2,6 @@ import os
 import sys
 import textwrap
 import argparse
-from itertools import product
 
 from lib.colorer import color_stdout
 
@@ -160,7 +159,11 @@ class Options(object):
                     Default: false.
                     """))
 
-        parser.add_argument(
+        # The server can be run under only one of the debugging
+        # tools at once.
+        debugger_group = parser.add_mutually_exclusive_group()
+
+        debugger_group.add_argument(
                 "--gdb",
                 dest="gdb",
                 action="store_true",
@@ -174,7 +177,7 @@ class Options(object):
                     Default: false.
                     """))
 
-        parser.add_argument(
+        debugger_group.add_argument(
                 "--gdbserver",
                 dest="gdbserver",
                 action="store_true",
@@ -187,7 +190,7 @@ class Options(object):
                     Default: false.
                     """))
 
-        parser.add_argument(
+        debugger_group.add_argument(
                 "--lldb",
                 dest="lldb",
                 action="store_true",
@@ -201,7 +204,7 @@ class Options(object):
                     Default: false.
                     """))
 
-        parser.add_argument(
+        debugger_group.add_argument(
                 "--valgrind",
                 dest="valgrind",
                 action="store_true",
@@ -214,7 +217,7 @@ class Options(object):
                     Default: false.
                     """))
 
-        parser.add_argument(
+        debugger_group.add_argument(
                 "--strace",
                 dest="strace",
                 action="store_true",
@@ -520,12 +523,19 @@ class Options(object):
         else:
             self.args.show_tags = False
 
-        self.check()
-
-        self.check_timeouts()
+        # --env and --tags (without a parameter) just print some
+        # information and exit, so don't validate the options
+        # needed to run tests.
+        if not self.is_info_only():
+            self.check()
+            self.check_timeouts()
 
         Options._initialized = True
 
+    def is_info_only(self):
+        """Whether test-run just prints some information and exits."""
+        return self.args.show_env or self.args.show_tags
+
     def check_timeouts(self) -> None:
         default_time_offset = 10
         if (self.args.no_output_timeout - self.args.test_timeout) < default_time_offset or \
@@ -534,19 +544,11 @@ class Options(object):
                          "Change the value(s) so that --no-output-timeout is at least 10 seconds "
                          "longer than --test-timeout\nand --test-timeout is at least 10 seconds "
                          "longer than --server-start-timeout\n", schema='error')
-            exit(1)
+            sys.exit(1)
 
     def check(self):
         """Check the arguments for correctness."""
         check_error = False
-        conflict_options = ('valgrind', 'gdb', 'lldb', 'strace')
-        for op1, op2 in product(conflict_options, repeat=2):
-            if op1 != op2 and getattr(self.args, op1, '') and \
-                    getattr(self.args, op2, ''):
-                format_str = "\nError: option --{} is not compatible with option --{}\n"
-                color_stdout(format_str.format(op1, op2), schema='error')
-                check_error = True
-                break
 
         snapshot_path = self.args.snapshot_path
         if self.args.disable_schema_upgrade and not snapshot_path:
@@ -559,9 +561,11 @@ class Options(object):
             check_error = True
 
         if check_error:
-            exit(-1)
+            sys.exit(-1)
 
     def check_schema_upgrade_option(self, is_debug):
+        if self.is_info_only():
+            return
         if self.args.disable_schema_upgrade and not is_debug:
             color_stdout("Can't disable schema upgrade on release build\n", schema='error')
-            exit(1)
+            sys.exit(1)
@@ -15,6 +15,7 @@ from lib.options import Options
 from lib.utils import print_tail_n
 from lib.utils import bytes_to_str
 from lib.utils import find_tags
+from lib.utils import substring_re
 
 DEFAULT_CHECKPOINT_PATTERNS = ["*.snap", "*.xlog", "*.vylog", "*.inprogress",
                                "[0-9]*/"]
@@ -30,6 +31,7 @@ class Server(object):
     DEFAULT_INSPECTOR = 0
     TEST_RUN_DIR = os.path.abspath(os.path.join(os.path.dirname(__file__),
                                                 ".."))
+    TEST_RUN_LUA = os.path.join(TEST_RUN_DIR, 'test_run.lua')
     # assert(false) hangs due to gh-4983, added fiber.sleep(0) to workaround it
     DISABLE_AUTO_UPGRADE = "require('fiber').sleep(0) \
         assert(box.error.injection.set('ERRINJ_AUTO_UPGRADE', true) == 'ok', \
@@ -186,12 +188,6 @@ class Server(object):
         # TODO: Support multiline comments (mainly for unit
         # tests).
 
-        def match_any_pattern(test_name, patterns):
-            for pattern in patterns:
-                if pattern in test_name:
-                    return True
-            return False
-
         def match_any_tag(test_name, accepted_tags):
             tags = find_tags(test_name)
             for tag in tags:
@@ -199,11 +195,12 @@ class Server(object):
                     return True
             return False
 
+        exclude_re = substring_re(exclude_patterns)
         accepted_tags = Options().args.tags
 
         res = []
         for test_name in test_names:
-            if match_any_pattern(test_name, exclude_patterns):
+            if exclude_re and exclude_re.search(test_name):
                 continue
             if accepted_tags is None or match_any_tag(test_name, accepted_tags):
                 res.append(test_name)
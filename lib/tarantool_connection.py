@@ -23,7 +23,6 @@ __author__ = "Konstantin Osipov <kostja.osipov@gmail.com>"
 
 import ctypes
 import errno
-import re
 import socket
 from contextlib import contextmanager
 
@@ -52,7 +51,7 @@ class TarantoolPool(ConnectionPool):
         # server in case of unix socket. It was not observed in case of tcp
         # sockets for unknown reason, so now we leave setting FD_CLOEXEC after
         # connect for tcp sockets and fix it only for unix sockets.
-        if self.host == 'unix/' or re.search(r'^/', str(self.port)):
+        if self.host == 'unix/' or str(self.port).startswith('/'):
             warn_unix_socket(self.port)
             result = gsocket.socket(gsocket.AF_UNIX, gsocket.SOCK_STREAM)
             set_fd_cloexec(result.fileno())
@@ -104,7 +103,7 @@ class TarantoolPool(ConnectionPool):
 class TarantoolConnection(object):
     @property
     def uri(self):
-        if self.host == 'unix/' or re.search(r'^/', str(self.port)):
+        if self.host == 'unix/' or str(self.port).startswith('/'):
             return self.port
         else:
             return self.host+':'+str(self.port)
@@ -113,12 +112,12 @@ class TarantoolConnection(object):
         self.host = host
         self.port = port
         self.is_connected = False
-        if self.host == 'unix/' or re.search(r'^/', str(self.port)):
+        if self.host == 'unix/' or str(self.port).startswith('/'):
             warn_unix_socket(self.port)
 
     def connect(self):
         # See comment in TarantoolPool._new_connection().
-        if self.host == 'unix/' or re.search(r'^/', str(self.port)):
+        if self.host == 'unix/' or str(self.port).startswith('/'):
             self.socket = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
             set_fd_cloexec(self.socket.fileno())
             self.socket.connect(self.port)
@@ -737,8 +737,8 @@ class TarantoolServer(Server):
                         ctl_dir + '/?.lua;' + \
                         ctl_dir + '/?/init.lua;' + \
                         os.environ.get("LUA_PATH", ";;")
-                cls.debug = bool(re.findall(r'^Target:.*-Debug$', str(cls.version()),
-                                            re.M))
+                cls.debug = bool(re.search(r'^Target:.*-Debug$',
+                                           str(cls.version()), re.M))
                 return exe
         raise RuntimeError("Can't find server executable in " + path)
 
@@ -820,8 +820,7 @@ class TarantoolServer(Server):
         if not os.path.exists(tntctl_file):
             tntctl_file = os.path.join(self.TEST_RUN_DIR, '.tarantoolctl')
         shutil.copy(tntctl_file, self.vardir)
-        shutil.copy(os.path.join(self.TEST_RUN_DIR, 'test_run.lua'),
-                    self.vardir)
+        shutil.copy(self.TEST_RUN_LUA, self.vardir)
 
         if self.snapshot_path:
             # Copy snapshot to the workdir.
@@ -1104,7 +1103,7 @@ class TarantoolServer(Server):
             timer.cancel()
 
         self.status = None
-        if re.search(r'^/', str(self._admin.port)):
+        if str(self._admin.port).startswith('/'):
             if os.path.exists(self._admin.port):
                 os.unlink(self._admin.port)
 
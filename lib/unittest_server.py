@@ -1,13 +1,12 @@
 import os
-import re
 import sys
-import glob
 from subprocess import Popen, PIPE, STDOUT
 
 from lib.sampler import sampler
 from lib.server import Server
 from lib.tarantool_server import Test
 from lib.tarantool_server import TarantoolServer
+from lib.utils import find_files_by_suffix
 
 
 class UnitTest(Test):
@@ -55,38 +54,33 @@ class UnittestServer(Server):
 
     def deploy(self, vardir=None, silent=True, wait=True):
         self.vardir = vardir
-        if not os.access(self.vardir, os.F_OK):
-            os.makedirs(self.vardir)
+        os.makedirs(self.vardir, exist_ok=True)
 
     @classmethod
     def find_exe(cls, builddir):
         cls.builddir = builddir
         cls.binary = TarantoolServer.binary
-        cls.debug = bool(re.findall(r'^Target:.*-Debug$', str(cls.version()),
-                                    re.M))
+        # The same executable, so reuse the build type found by
+        # TarantoolServer.find_exe() instead of running it again.
+        cls.debug = TarantoolServer.debug
 
     @staticmethod
     def find_tests(test_suite, suite_path):
-        def patterned(test, patterns):
-            answer = []
-            for i in patterns:
-                if test.name.find(i) != -1:
-                    answer.append(test)
-            return answer
-
         test_suite.ini['suite'] = suite_path
-        tests = glob.glob(os.path.join(suite_path, "*.test"))
+        tests = find_files_by_suffix(suite_path, '.test')
 
         if not tests:
-            executable_path_glob = os.path.join(test_suite.args.builddir,
-                                                'test', suite_path, '*.test')
-            tests = glob.glob(executable_path_glob)
+            executable_dir = os.path.join(test_suite.args.builddir, 'test',
+                                          suite_path)
+            tests = find_files_by_suffix(executable_dir, '.test')
 
         tests = Server.exclude_tests(tests, test_suite.args.exclude)
         test_suite.tests = [UnitTest(k, test_suite.args, test_suite.ini)
                             for k in sorted(tests)]
-        test_suite.tests = sum([patterned(x, test_suite.args.tests)
-                                for x in test_suite.tests], [])
+        # Add a test once for each include pattern that matches it.
+        test_suite.tests = [test for test in test_suite.tests
+                            for pattern in test_suite.args.tests
+                            if pattern in test.name]
 
     def print_log(self, lines):
         pass
@@ -1,10 +1,12 @@
 import errno
 import os
+import re
 import sys
 import collections
 import signal
 import fcntl
 import difflib
+import functools
 import time
 import json
 import subprocess
@@ -347,7 +349,21 @@ def parse_tag_line(line):
 
 def find_tags(filename):
     """ Extract tags from a first comment in the file.
+
+        The result is cached until the file is modified: a test
+        may be looked up once per each of its tasks (see
+        show_tags() in test-run.py).
     """
+    try:
+        mtime = os.stat(filename).st_mtime_ns
+    except OSError:
+        # Let _find_tags() raise a usual error on open().
+        mtime = None
+    return list(_find_tags(filename, mtime))
+
+
+@functools.lru_cache(maxsize=4096)
+def _find_tags(filename, mtime):
     # TODO: Support multiline comments. See exclude_tests() in
     # lib/server.py.
     if filename.endswith('.lua') or filename.endswith('.sql'):
@@ -355,7 +371,7 @@ def find_tags(filename):
     elif filename.endswith('.py'):
         singleline_comment = '#'
     else:
-        return []
+        return ()
 
     tags = []
     with open(filename, 'r') as f:
@@ -371,7 +387,37 @@ def find_tags(filename):
                 pass
             else:
                 break
-    return tags
+    return tuple(tags)
+
+
+def substring_re(patterns):
+    """ Compile a regex that matches a string containing any of
+        the given substrings. Return None if there are no
+        substrings.
+
+        It allows to check a string against all the patterns in
+        one scan.
+    """
+    if not patterns:
+        return None
+    return re.compile('|'.join(re.escape(p) for p in patterns))
+
+
+def find_files_by_suffix(dirname, suffix):
+    """ Return paths of regular files (following symlinks) in the
+        given directory whose names end with the given suffix.
+
+        Hidden files, directories and broken symlinks are skipped.
+        Return an empty list if the directory does not exist.
+    """
+    try:
+        with os.scandir(dirname) as it:
+            return [entry.path for entry in it
+                    if entry.name.endswith(suffix) and
+                    not entry.name.startswith('.') and
+                    entry.is_file()]
+    except FileNotFoundError:
+        return []
 
 
 def prepend_path(p):
@@ -0,0 +1,41 @@
+import socket
+import time
+import unittest
+
+from lib.box_connection import BoxConnection
+
+
+class TestBoxConnection(unittest.TestCase):
+    def setUp(self):
+        self.con = BoxConnection('localhost', 3301)
+        # Substitute the connection socket with one end of a
+        # socket pair. The timeout is the same as BoxConnection
+        # sets.
+        self.sock, self.peer = socket.socketpair()
+        self.sock.settimeout(100)
+        self.con.py_con._socket = self.sock
+
+    def tearDown(self):
+        self.sock.close()
+        self.peer.close()
+
+    def test_check_connection_alive_idle(self):
+        start = time.monotonic()
+        self.assertTrue(self.con.check_connection())
+        self.assertLess(time.monotonic() - start, 1)
+        self.assertEqual(self.sock.gettimeout(), 100)
+
+    def test_check_connection_pending_data(self):
+        self.peer.sendall(b'x')
+        self.assertTrue(self.con.check_connection())
+        # The data is peeked, not consumed.
+        self.assertEqual(self.sock.recv(1), b'x')
+
+    def test_check_connection_closed(self):
+        self.peer.close()
+        self.assertFalse(self.con.check_connection())
+        self.assertEqual(self.sock.gettimeout(), 100)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,3 +1,5 @@
+import os
+import tempfile
 import unittest
 
 import lib.utils as utils
@@ -9,6 +11,63 @@ class TestUtils(unittest.TestCase):
         v = utils.extract_schema_from_snapshot(snapshot_path)
         self.assertEqual(v, (2, 3, 1))
 
+    def test_find_files_by_suffix(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            for name in ('foo_test.lua', '.hidden_test.lua', 'bar.lua'):
+                open(os.path.join(tmpdir, name), 'w').close()
+            os.mkdir(os.path.join(tmpdir, 'dir_test.lua'))
+            os.symlink('foo_test.lua', os.path.join(tmpdir, 'link_test.lua'))
+            os.symlink('none', os.path.join(tmpdir, 'broken_test.lua'))
+
+            res = utils.find_files_by_suffix(tmpdir, '_test.lua')
+            self.assertEqual(sorted(res), [
+                os.path.join(tmpdir, 'foo_test.lua'),
+                os.path.join(tmpdir, 'link_test.lua'),
+            ])
+
+            missing = os.path.join(tmpdir, 'missing')
+            self.assertEqual(utils.find_files_by_suffix(missing, '.lua'), [])
+
+    def test_substring_re(self):
+        self.assertIsNone(utils.substring_re([]))
+        self.assertIsNone(utils.substring_re(None))
+
+        regex = utils.substring_re(['a.b', 'c*'])
+        self.assertTrue(regex.search('foo/a.b.test.lua'))
+        self.assertTrue(regex.search('c*'))
+        self.assertFalse(regex.search('axb'))
+        self.assertFalse(regex.search('ccc'))
+
+        # An empty pattern matches any name like `'' in name` does.
+        regex = utils.substring_re([''])
+        self.assertTrue(regex.search(''))
+        self.assertTrue(regex.search('foo.test.lua'))
+
+    def test_find_tags(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, 'foo.test.lua')
+
+            # A missing file raises an error and is not cached.
+            with self.assertRaises(FileNotFoundError):
+                utils.find_tags(filename)
+            with open(filename, 'w') as f:
+                f.write('-- tags: foo, bar\n')
+            os.utime(filename, ns=(1000000000, 1000000000))
+            self.assertEqual(utils.find_tags(filename), ['foo', 'bar'])
+
+            # A repeated call returns an equal, but separate list.
+            tags = utils.find_tags(filename)
+            tags.append('baz')
+            self.assertEqual(utils.find_tags(filename), ['foo', 'bar'])
+            self.assertIsNot(utils.find_tags(filename),
+                             utils.find_tags(filename))
+
+            # Rewriting the file invalidates the cached result.
+            with open(filename, 'w') as f:
+                f.write('-- tags: baz\n')
+            os.utime(filename, ns=(2000000000, 2000000000))
+            self.assertEqual(utils.find_tags(filename), ['baz'])
+
 
 if __name__ == "__main__":
     unittest.main()